@@ -1,12 +1,16 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, stream_with_context
 import os
-from config import LOG_FILE
+import json
+import queue
+import time
+from config import LOG_FILE, LOG_STREAM_MAX_DURATION
 
 # Import security components
 from security.input_sanitizer import InputSanitizer
 from security.output_sanitizer import OutputSanitizer
 from security.prompt_injection import PromptInjectionDetector
 from security.threat_monitor import ThreatMonitor
+from security.log_stream import LogStream, format_event_id, parse_event_id
 from security.security_utils import log_security_event
 
 # Import LLM service
@@ -20,6 +24,7 @@ input_sanitizer = InputSanitizer()
 output_sanitizer = OutputSanitizer()
 injection_detector = PromptInjectionDetector()
 threat_monitor = ThreatMonitor()
+log_stream = LogStream()
 llm_service = LLMService()
 
 @app.route('/')
@@ -30,8 +35,65 @@ def index():
 @app.route('/logs')
 def logs():
     """Render the security logs page."""
-    recent_threats = threat_monitor.get_recent_threats(limit=100)
-    return render_template('logs.html', threats=recent_threats)
+    recent_threats, log_position = threat_monitor.get_recent_threats_with_position(limit=100)
+    return render_template('logs.html', threats=recent_threats,
+                           log_position=format_event_id(log_position))
+
+@app.route('/api/logs/stream')
+def logs_stream():
+    """
+    Push new security log entries to the logs page as Server-Sent Events.
+
+    All connected dashboards share one reader tailing the log file, so open
+    pages no longer need to be refreshed to see new events. Each event's id
+    is its position in the log; clients resume from the position the page
+    was rendered from or from Last-Event-ID, and anything in between is
+    backfilled. A client too far behind is told to reload the page instead.
+    Streams are closed after LOG_STREAM_MAX_DURATION seconds so they never
+    hold a worker indefinitely; EventSource reconnects on its own.
+    """
+    start_position = (parse_event_id(request.headers.get('Last-Event-ID'))
+                      or parse_event_id(request.args.get('position')))
+
+    client_queue, backfill, last_offset = log_stream.subscribe(start_position)
+    deadline = time.time() + LOG_STREAM_MAX_DURATION
+
+    def format_event(item):
+        inode, offset, entry = item
+        return f"id: {format_event_id((inode, offset))}\ndata: {json.dumps(entry)}\n\n"
+
+    def generate(last_offset):
+        try:
+            if backfill is None:
+                yield 'event: reload\ndata: \n\n'
+                return
+            for item in backfill:
+                last_offset = item[1]
+                yield format_event(item)
+
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                try:
+                    item = client_queue.get(timeout=min(remaining, 15))
+                except queue.Empty:
+                    # Keep-alive comment so proxies don't close the connection
+                    yield ': keep-alive\n\n'
+                    continue
+                if item is None:
+                    # Dropped for falling behind; the browser will reconnect
+                    return
+                if last_offset is not None and item[1] <= last_offset:
+                    # Already shown by the rendered page or a previous stream
+                    continue
+                last_offset = item[1]
+                yield format_event(item)
+        finally:
+            log_stream.unsubscribe(client_queue)
+
+    return Response(stream_with_context(generate(last_offset)), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
@@ -11,6 +11,7 @@ GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.0-flash')
 # Security Configuration
 MAX_INPUT_LENGTH = 1000  # Maximum allowed input length
 LOG_FILE = 'security_logs.jsonl'  # Security log file
+LOG_STREAM_MAX_DURATION = 25  # Seconds before a live log stream is closed and the browser reconnects
 BLOCKED_PATTERNS = [
     # Prompt injection attempts
     "ignore previous instructions",
@@ -0,0 +1,326 @@
+import os
+import json
+import queue
+import select
+import ctypes
+import ctypes.util
+import threading
+from config import LOG_FILE
+
+# inotify constants (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+def _open_inotify(path):
+    """
+    Watch the directory containing path with inotify, if the platform has it.
+
+    The directory is watched rather than the file itself so that the log
+    being created, truncated or replaced is still noticed.
+
+    Args:
+        path (str): File whose changes should wake the reader
+
+    Returns:
+        int or None: inotify file descriptor, or None if unavailable
+    """
+    libc_name = ctypes.util.find_library('c')
+    if not libc_name:
+        return None
+
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+
+    fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        return None
+
+    directory = os.path.dirname(os.path.abspath(path))
+    mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    if inotify_add_watch(fd, directory.encode(), mask) < 0:
+        os.close(fd)
+        return None
+
+    return fd
+
+
+def parse_log_lines(data, base_offset):
+    """
+    Parse complete JSON lines from a chunk of the log file.
+
+    Args:
+        data (bytes): Raw bytes read from the log
+        base_offset (int): Byte offset of data within the file
+
+    Returns:
+        tuple: (entries, remainder) where entries is a list of
+            (end_offset, entry) pairs and remainder is the trailing
+            incomplete line
+    """
+    entries = []
+    position = base_offset
+    lines = data.split(b'\n')
+    # Keep an incomplete trailing line until the writer finishes it
+    remainder = lines.pop()
+    for line in lines:
+        position += len(line) + 1
+        try:
+            entries.append((position, json.loads(line.decode('utf-8').strip())))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+    return entries, remainder
+
+
+def format_event_id(position):
+    """
+    Format a log position as an SSE event id.
+
+    Args:
+        position (tuple): (inode, offset) of the log file
+
+    Returns:
+        str: Event id of the form "inode:offset"
+    """
+    inode, offset = position
+    return f"{inode}:{offset}"
+
+
+def parse_event_id(value):
+    """
+    Parse an SSE event id produced by format_event_id().
+
+    Args:
+        value (str): Event id sent back by the client
+
+    Returns:
+        tuple or None: (inode, offset), or None if the id is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        inode, offset = (int(part) for part in value.split(':'))
+    except ValueError:
+        return None
+    if inode < 0 or offset < 0:
+        return None
+    return inode, offset
+
+
+class LogStream:
+    """
+    Tails the security log file from the last read offset and fans new
+    entries out to every subscriber from a single shared reader thread.
+
+    The reader waits on inotify where available and falls back to polling
+    the file size otherwise, so connected dashboards never cause the whole
+    log to be re-read. Each entry is tagged with the log's inode and the
+    byte offset just past its line, which clients use to resume without
+    gaps or duplicates.
+
+    The reader is shared per process; each server worker runs its own.
+    """
+
+    def __init__(self, log_file=LOG_FILE):
+        self.log_file = log_file
+        self.subscribers = set()   # set of queue.Queue, one per client
+        self.lock = threading.Lock()
+        self.thread = None
+
+        # Reader settings
+        self.poll_interval = 1.0   # seconds between checks without inotify
+        self.max_queue_size = 1000  # pending entries before a client is dropped
+        self.max_backfill_bytes = 256 * 1024  # furthest a client may resume from
+
+        self.offset = 0
+        self.partial = b''
+        self.inode = 0
+        self.inotify_fd = None
+
+    @property
+    def published_offset(self):
+        """Byte offset up to which entries have been handed to subscribers."""
+        return self.offset - len(self.partial)
+
+    def subscribe(self, start_position=None):
+        """
+        Register a new client and start the shared reader if needed.
+
+        Args:
+            start_position (tuple): (inode, offset) the client has already
+                seen, e.g. the position the page was rendered from or the
+                Last-Event-ID. Entries after it are backfilled.
+
+        Returns:
+            tuple: (client_queue, backfill, start_offset) where client_queue
+                receives (inode, offset, entry) items as new entries arrive
+                (or None once the client is dropped), backfill is a list of
+                items to send first, or None if the client is too far behind
+                to catch up, and start_offset is the offset already seen
+        """
+        client_queue = queue.Queue(maxsize=self.max_queue_size)
+        with self.lock:
+            if self.thread is None:
+                self.inode, self.offset = self._file_stat()
+                self.partial = b''
+                self.inotify_fd = _open_inotify(self.log_file)
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+
+            inode, end = self.inode, self.published_offset
+            self.subscribers.add(client_queue)
+
+        if start_position is None or start_position[1] < 0:
+            return client_queue, [], None
+
+        start_inode, start_offset = start_position
+        if start_inode != inode or start_offset > self._file_stat()[1]:
+            # Position refers to an older log; replay this one from the top
+            start_offset = 0
+
+        if start_offset >= end:
+            # Reader has not caught up yet; live entries cover the gap
+            return client_queue, [], start_offset
+        if end - start_offset > self.max_backfill_bytes:
+            return client_queue, None, None
+
+        # Read outside the lock so a catching-up client never stalls the reader
+        return client_queue, self._read_range(inode, start_offset, end), start_offset
+
+    def unsubscribe(self, client_queue):
+        """
+        Remove a client so it no longer receives entries.
+
+        Args:
+            client_queue (queue.Queue): Queue returned by subscribe()
+        """
+        with self.lock:
+            self.subscribers.discard(client_queue)
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.log_file)
+        except OSError:
+            return 0, 0
+        return stat.st_ino, stat.st_size
+
+    def _wait_for_change(self):
+        """Block until the log may have changed."""
+        if self.inotify_fd is None:
+            threading.Event().wait(self.poll_interval)
+            return
+
+        try:
+            # The timeout doubles as a safety net for missed notifications
+            readable, _, _ = select.select([self.inotify_fd], [], [], self.poll_interval * 5)
+            if readable:
+                while os.read(self.inotify_fd, 4096):
+                    pass
+        except BlockingIOError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error watching log file, falling back to polling: {e}")
+            try:
+                os.close(self.inotify_fd)
+            except OSError:
+                pass
+            self.inotify_fd = None
+
+    def _read_range(self, inode, start, end):
+        """
+        Read the entries between two offsets of the log file.
+
+        Args:
+            inode (int): Inode the offsets refer to
+            start (int): Offset to start reading from
+            end (int): Offset to stop reading at
+
+        Returns:
+            list: (inode, end_offset, entry) items, oldest first; empty if
+                the log has since been replaced
+        """
+        try:
+            with open(self.log_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_ino != inode:
+                    return []
+                f.seek(start)
+                data = f.read(end - start)
+        except OSError:
+            return []
+        entries, _ = parse_log_lines(data, start)
+        return [(inode, offset, entry) for offset, entry in entries]
+
+    def _read_new_entries(self):
+        """
+        Read lines appended since the last offset.
+
+        Returns:
+            list: (inode, end_offset, entry) items, oldest first
+        """
+        inode, size = self._file_stat()
+        if inode != self.inode or size < self.offset:
+            # Log was truncated or replaced; start again from the top.
+            # Clients reconnect and find their position no longer matches.
+            self.inode = inode
+            self.offset = 0
+            self.partial = b''
+            for client_queue in list(self.subscribers):
+                self._drop(client_queue)
+        if size == self.offset:
+            return []
+
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read(size - self.offset)
+        except OSError:
+            return []
+
+        base_offset = self.published_offset
+        self.offset += len(data)
+        entries, self.partial = parse_log_lines(self.partial + data, base_offset)
+        return [(inode, offset, entry) for offset, entry in entries]
+
+    def _drop(self, client_queue):
+        """
+        Disconnect a client; its stream ends and the browser reconnects.
+
+        Undelivered entries are discarded so the client's Last-Event-ID is
+        the last entry it actually received and backfill fills the gap.
+        """
+        self.subscribers.discard(client_queue)
+        while True:
+            try:
+                client_queue.get_nowait()
+            except queue.Empty:
+                break
+        client_queue.put_nowait(None)
+
+    def _publish(self, item):
+        for client_queue in list(self.subscribers):
+            try:
+                client_queue.put_nowait(item)
+            except queue.Full:
+                # Slow client; it resumes from Last-Event-ID on reconnect
+                self._drop(client_queue)
+
+    def _run(self):
+        while True:
+            try:
+                self._wait_for_change()
+                # Read and publish under the lock so subscribe() always sees
+                # an offset consistent with what has been delivered
+                with self.lock:
+                    for item in self._read_new_entries():
+                        self._publish(item)
+            except Exception as e:
+                print(f"Error reading security log stream: {e}")
+                threading.Event().wait(self.poll_interval)
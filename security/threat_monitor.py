@@ -1,3 +1,4 @@
+import os
 import json
 import time
 from datetime import datetime, timedelta
@@ -128,17 +129,37 @@ class ThreatMonitor:
         Returns:
             list: List of threat log entries
         """
+        threats, _ = self.get_recent_threats_with_position(limit)
+        return threats
+    
+    def get_recent_threats_with_position(self, limit=50):
+        """
+        Get the most recent security threats along with the position in the
+        log file they were read up to, so live updates can resume from it.
+        
+        Args:
+            limit (int): Maximum number of threats to return
+            
+        Returns:
+            tuple: (threats, position) where position is (inode, offset)
+        """
         threats = []
         try:
-            with open(LOG_FILE, 'r') as f:
-                for line in f:
-                    try:
-                        threat = json.loads(line.strip())
-                        threats.append(threat)
-                    except json.JSONDecodeError:
-                        continue
+            with open(LOG_FILE, 'rb') as f:
+                inode = os.fstat(f.fileno()).st_ino
+                data = f.read()
         except FileNotFoundError:
-            return []
+            return [], (0, 0)
+        
+        # Ignore a trailing line that is still being written
+        offset = data.rfind(b'\n') + 1
+        for line in data[:offset].splitlines():
+            try:
+                threat = json.loads(line.decode('utf-8').strip())
+                threats.append(threat)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
         
         # Sort by timestamp (newest first) and limit
-        return sorted(threats, key=lambda x: x.get('timestamp', ''), reverse=True)[:limit]
\ No newline at end of file
+        threats = sorted(threats, key=lambda x: x.get('timestamp', ''), reverse=True)[:limit]
+        return threats, (inode, offset)
@@ -1,6 +1,6 @@
 /**
  * LLM Shield Main JavaScript
- * Handles chat interactions and system status
+ * Handles chat interactions, live security logs and system status
  */
 
 // DOM Elements
@@ -10,6 +10,7 @@ const sendButton = document.getElementById('send-button');
 const statusDot = document.querySelector('.status-dot');
 const statusText = document.getElementById('status-text');
 const systemStatus = document.getElementById('system-status');
+const logsBody = document.getElementById('logs-body');
 
 // State
 let isProcessing = false;
@@ -19,6 +20,9 @@ document.addEventListener('DOMContentLoaded', () => {
     // Check system health on load
     checkSystemHealth();
     
+    // Stream new security events into the logs page
+    subscribeToLogs();
+    
     // Set up event listeners
     if (sendButton && userInput) {
         sendButton.addEventListener('click', handleSendMessage);
@@ -171,4 +175,68 @@ async function checkSystemHealth() {
         systemStatus.className = 'unhealthy';
         console.error('Health check error:', error);
     }
-}
\ No newline at end of file
+}
+
+/**
+ * Subscribe to the security log stream and add new events to the logs table
+ */
+function subscribeToLogs() {
+    if (!logsBody || !window.EventSource) return;
+    
+    // Resume from the position the page was rendered from. EventSource
+    // reconnects on its own and sends Last-Event-ID, so nothing is lost
+    // when the server closes the stream.
+    const position = encodeURIComponent(logsBody.dataset.position || '');
+    const source = new EventSource(`/api/logs/stream?position=${position}`);
+    
+    // Sent when this page is too far behind to catch up incrementally
+    source.addEventListener('reload', () => {
+        source.close();
+        window.location.reload();
+    });
+    
+    source.onmessage = (event) => {
+        try {
+            addLogEntry(JSON.parse(event.data));
+        } catch (error) {
+            console.error('Log stream error:', error);
+        }
+    };
+}
+
+/**
+ * Add a log entry to the top of the logs table
+ * @param {Object} threat - Parsed security log entry
+ */
+function addLogEntry(threat) {
+    const noLogsRow = document.getElementById('no-logs-row');
+    if (noLogsRow) {
+        noLogsRow.remove();
+    }
+    
+    const row = document.createElement('tr');
+    row.className = 'log-entry';
+    
+    // Use textContent so log contents are never interpreted as HTML
+    const fields = ['timestamp', 'threat_type', 'source', 'details', 'action_taken'];
+    fields.forEach(field => {
+        const cell = document.createElement('td');
+        const value = threat[field] !== undefined ? String(threat[field]) : '';
+        if (field === 'threat_type') {
+            const badge = document.createElement('span');
+            badge.className = 'threat-type';
+            badge.textContent = value;
+            cell.appendChild(badge);
+        } else {
+            cell.textContent = value;
+        }
+        row.appendChild(cell);
+    });
+    
+    // Newest first, keeping the table at the server-rendered size
+    logsBody.insertBefore(row, logsBody.firstChild);
+    const limit = parseInt(logsBody.dataset.limit, 10) || 100;
+    while (logsBody.rows.length > limit) {
+        logsBody.deleteRow(-1);
+    }
+}
@@ -0,0 +1,109 @@
+import os
+import json
+import queue
+import pytest
+from security.log_stream import LogStream, parse_log_lines, parse_event_id, format_event_id
+
+
+def line(n):
+    return (json.dumps({"n": n}) + '\n').encode()
+
+
+def append(path, data):
+    with open(path, 'ab') as f:
+        f.write(data)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / 'security_logs.jsonl'
+    path.write_bytes(line(1) + line(2))
+    return str(path)
+
+
+@pytest.fixture
+def stream(log_file):
+    stream = LogStream(log_file)
+    stream.poll_interval = 0.05
+    return stream
+
+
+def test_parse_log_lines_offsets():
+    data = line(1) + b'not json\n' + line(2) + b'{"n": 3'
+    entries, remainder = parse_log_lines(data, 100)
+
+    assert entries == [(100 + len(line(1)), {"n": 1}),
+                       (100 + len(data) - len(b'{"n": 3'), {"n": 2})]
+    assert remainder == b'{"n": 3'
+
+
+def test_parse_event_id():
+    assert parse_event_id(format_event_id((12, 34))) == (12, 34)
+    assert parse_event_id('12:-1') is None
+    assert parse_event_id('-1') is None
+    assert parse_event_id('abc') is None
+    assert parse_event_id(None) is None
+
+
+def test_negative_offset_does_not_break_reader(stream, log_file):
+    inode = os.stat(log_file).st_ino
+    client_queue, backfill, last_offset = stream.subscribe((inode, -1))
+    assert backfill == [] and last_offset is None
+    assert stream.offset >= 0
+
+    other_queue, _, _ = stream.subscribe()
+    append(log_file, line(3))
+    assert other_queue.get(timeout=2)[2] == {"n": 3}
+
+
+def test_backfill_from_rendered_position(stream, log_file):
+    stream.subscribe()
+    inode = os.stat(log_file).st_ino
+    _, backfill, last_offset = stream.subscribe((inode, len(line(1))))
+
+    assert [entry for _, _, entry in backfill] == [{"n": 2}]
+    assert last_offset == len(line(1))
+
+
+def test_backfill_restarts_on_generation_mismatch(stream, log_file):
+    stream.subscribe()
+    inode = os.stat(log_file).st_ino
+    _, backfill, last_offset = stream.subscribe((inode + 1, len(line(1))))
+
+    assert [entry for _, _, entry in backfill] == [{"n": 1}, {"n": 2}]
+    assert last_offset == 0
+
+
+def test_backfill_too_far_behind(stream, log_file):
+    stream.max_backfill_bytes = 1
+    stream.subscribe()
+    inode = os.stat(log_file).st_ino
+    _, backfill, last_offset = stream.subscribe((inode, 0))
+
+    assert backfill is None and last_offset is None
+
+
+def test_slow_client_drop_discards_all_pending(stream):
+    stream.max_queue_size = 3
+    client_queue = queue.Queue(maxsize=stream.max_queue_size)
+    stream.subscribers.add(client_queue)
+    for n in range(4):
+        stream._publish((0, n, {"n": n}))
+
+    # The client resumes from the last entry it received, not past a gap
+    assert client_queue.get_nowait() is None
+    assert client_queue.empty()
+    assert client_queue not in stream.subscribers
+
+
+def test_replaced_log_restarts_from_top(stream, log_file, tmp_path):
+    client_queue, _, _ = stream.subscribe()
+    old_inode = os.stat(log_file).st_ino
+
+    replacement = tmp_path / 'new.jsonl'
+    replacement.write_bytes(line('a') + line('b') + line('c'))
+    os.replace(replacement, log_file)
+
+    assert client_queue.get(timeout=2) is None
+    _, backfill, _ = stream.subscribe((old_inode, len(line(1))))
+    assert [entry for _, _, entry in backfill] == [{"n": 'a'}, {"n": 'b'}, {"n": 'c'}]